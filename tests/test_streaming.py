@@ -1,6 +1,5 @@
 from __future__ import annotations as _annotations
 
-import json
 from collections.abc import AsyncIterator
 from datetime import timezone
 
@@ -42,7 +41,9 @@ async def test_streamed_text_response():
         assert test_agent.name == 'test_agent'
         assert not result.is_structured
         assert not result.is_complete
-        assert result.all_messages() == snapshot(
+        # copy, since `all_messages()` returns the run's message list which is extended in place
+        messages_before = list(result.all_messages())
+        assert messages_before == snapshot(
             [
                 UserPrompt(content='Hello', timestamp=IsNow(tz=timezone.utc)),
                 ModelStructuredResponse(
@@ -57,16 +58,12 @@ async def test_streamed_text_response():
         assert result.is_complete
         assert result.cost() == snapshot(Cost())
         assert result.timestamp() == IsNow(tz=timezone.utc)
-        assert result.all_messages() == snapshot(
-            [
-                UserPrompt(content='Hello', timestamp=IsNow(tz=timezone.utc)),
-                ModelStructuredResponse(
-                    calls=[ToolCall(tool_name='ret_a', args=ArgsDict(args_dict={'x': 'a'}))],
-                    timestamp=IsNow(tz=timezone.utc),
-                ),
-                ToolReturn(tool_name='ret_a', content='a-apple', timestamp=IsNow(tz=timezone.utc)),
-                ModelTextResponse(content='{"ret_a":"a-apple"}', timestamp=IsNow(tz=timezone.utc)),
-            ]
+        messages_after = result.all_messages()
+        # the prefix holds the same message objects, so this only checks none were removed or reordered,
+        # not that they were left unmodified
+        assert messages_after[:3] == messages_before
+        assert messages_after[3:] == snapshot(
+            [ModelTextResponse(content='{"ret_a":"a-apple"}', timestamp=IsNow(tz=timezone.utc))]
         )
 
 
@@ -89,7 +86,7 @@ async def test_structured_response_iter():
         assert agent_info.result_tools is not None
         assert len(agent_info.result_tools) == 1
         name = agent_info.result_tools[0].name
-        json_data = json.dumps({'response': [1, 2, 3, 4]})
+        json_data = '{"response": [1, 2, 3, 4]}'
         yield {0: DeltaToolCall(name=name)}
         yield {0: DeltaToolCall(json_args=json_data[:15])}
         yield {0: DeltaToolCall(json_args=json_data[15:])}
@@ -98,9 +95,9 @@ async def test_structured_response_iter():
 
     chunks: list[list[int]] = []
     async with agent.run_stream('') as result:
+        validate = result.validate_structured_result
         async for structured_response, last in result.stream_structured(debounce_by=None):
-            response_data = await result.validate_structured_result(structured_response, allow_partial=not last)
-            chunks.append(response_data)
+            chunks.append(await validate(structured_response, allow_partial=not last))
 
     assert chunks == snapshot([[1], [1, 2, 3, 4], [1, 2, 3, 4]])
 
@@ -111,9 +108,7 @@ async def test_structured_response_iter():
 
 
 async def test_streamed_text_stream():
-    m = TestModel(custom_result_text='The cat sat on the mat.')
-
-    agent = Agent(m)
+    agent = Agent(TestModel(custom_result_text='The cat sat on the mat.'))
 
     async with agent.run_stream('Hello') as result:
         assert not result.is_structured
@@ -123,6 +118,10 @@ async def test_streamed_text_stream():
         assert chunks == snapshot(['The cat sat on the mat.'])
         assert result.is_complete
 
+
+async def test_streamed_text_stream_no_debounce():
+    agent = Agent(TestModel(custom_result_text='The cat sat on the mat.'))
+
     async with agent.run_stream('Hello') as result:
         assert [c async for c in result.stream(debounce_by=None)] == snapshot(
             [
@@ -135,11 +134,19 @@ async def test_streamed_text_stream():
             ]
         )
 
+
+async def test_streamed_text_stream_delta():
+    agent = Agent(TestModel(custom_result_text='The cat sat on the mat.'))
+
     async with agent.run_stream('Hello') as result:
         assert [c async for c in result.stream_text(delta=True, debounce_by=None)] == snapshot(
             ['The ', 'cat ', 'sat ', 'on ', 'the ', 'mat.']
         )
 
+
+async def test_streamed_text_stream_structured():
+    agent = Agent(TestModel(custom_result_text='The cat sat on the mat.'))
+
     async with agent.run_stream('Hello') as result:
         with pytest.raises(UserError, match=r'stream_structured\(\) can only be used with structured responses'):
             async for _ in result.stream_structured():
@@ -175,17 +182,19 @@ async def test_call_tool():
             name = agent_info.function_tools[0].name
             first = messages[0]
             assert isinstance(first, UserPrompt)
-            json_string = json.dumps({'x': first.content})
+            assert first.content == 'hello'
+            json_string = '{"x": "hello"}'
             yield {0: DeltaToolCall(name=name)}
             yield {0: DeltaToolCall(json_args=json_string[:3])}
             yield {0: DeltaToolCall(json_args=json_string[3:])}
         else:
             last = messages[-1]
             assert isinstance(last, ToolReturn)
+            assert last.content == 'hello world'
             assert agent_info.result_tools is not None
             assert len(agent_info.result_tools) == 1
             name = agent_info.result_tools[0].name
-            json_data = json.dumps({'response': [last.content, 2]})
+            json_data = '{"response": ["hello world", 2]}'
             yield {0: DeltaToolCall(name=name)}
             yield {0: DeltaToolCall(json_args=json_data[:5])}
             yield {0: DeltaToolCall(json_args=json_data[5:])}
@@ -198,7 +207,9 @@ async def test_call_tool():
         return f'{x} world'
 
     async with agent.run_stream('hello') as result:
-        assert result.all_messages() == snapshot(
+        # copy, since `all_messages()` returns the run's message list which is extended in place
+        messages_before = list(result.all_messages())
+        assert messages_before == snapshot(
             [
                 UserPrompt(content='hello', timestamp=IsNow(tz=timezone.utc)),
                 ModelStructuredResponse(
@@ -214,19 +225,12 @@ async def test_call_tool():
             ]
         )
         assert await result.get_data() == snapshot(('hello world', 2))
-        assert result.all_messages() == snapshot(
+        messages_after = result.all_messages()
+        # the prefix holds the same message objects, so this only checks none were removed or reordered,
+        # not that they were left unmodified
+        assert messages_after[:4] == messages_before
+        assert messages_after[4:] == snapshot(
             [
-                UserPrompt(content='hello', timestamp=IsNow(tz=timezone.utc)),
-                ModelStructuredResponse(
-                    calls=[ToolCall(tool_name='ret_a', args=ArgsJson(args_json='{"x": "hello"}'))],
-                    timestamp=IsNow(tz=timezone.utc),
-                ),
-                ToolReturn(tool_name='ret_a', content='hello world', timestamp=IsNow(tz=timezone.utc)),
-                ToolReturn(
-                    tool_name='final_result',
-                    content='Final result processed.',
-                    timestamp=IsNow(tz=timezone.utc),
-                ),
                 ModelStructuredResponse(
                     calls=[
                         ToolCall(
@@ -235,7 +239,7 @@ async def test_call_tool():
                         )
                     ],
                     timestamp=IsNow(tz=timezone.utc),
-                ),
+                )
             ]
         )
 